@@ -1,12 +1,21 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Query
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from bson import Binary
 import os
 import logging
+import asyncio
+import multiprocessing
 import io
-import tempfile
+import csv
+import math
+import base64
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional
@@ -14,8 +23,10 @@ import uuid
 from datetime import datetime, timezone
 import pandas as pd
 import numpy as np
+import prophet
 from prophet import Prophet
-from sklearn.metrics import mean_squared_error, mean_absolute_percentage_error
+from prophet.serialize import model_to_json, model_from_json
+from numba import njit
 import plotly.graph_objects as go
 import plotly.utils
 import json
@@ -25,11 +36,19 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_POOL', 50)),
+    minPoolSize=5,
+    maxIdleTimeMS=60000,
+    retryWrites=True,
+    # Wire compression for the large embedded chart/forecast payloads
+    compressors='zstd,zlib'
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -56,87 +75,344 @@ class PredictionResult(BaseModel):
     mape: float
     chart_data: dict
 
+# Fitted Prophet models are cached in-process and on disk, keyed on the training series.
+# Prophet objects are not pickle-stable across versions, so they are never stored in MongoDB;
+# the disk cache uses Prophet's JSON serialization and keys on the installed version.
+PROPHET_PARAMS = {
+    'changepoint_prior_scale': 0.05,
+    # prophet>=1.1.4 samples the predictive posterior with vectorized NumPy,
+    # so a reduced draw count keeps intervals stable at a fraction of the cost
+    'uncertainty_samples': 200
+}
+MODEL_CACHE_SIZE = 32
+MODEL_CACHE_DIR = Path(os.environ.get('PROPHET_CACHE_DIR', '/tmp/prophet_cache'))
+MODEL_CACHE_DISK_ENTRIES = max(1, int(os.environ.get('PROPHET_CACHE_ENTRIES', 256)))
+_model_cache = OrderedDict()
+
+# Prophet fitting is CPU-bound, so it runs in a process pool rather than on the event loop.
+# Each worker keeps its own in-memory model cache; the disk cache is shared between them.
+# Workers come from a forkserver (spawn where it is unavailable, e.g. Windows), since forking
+# this process would copy the Motor/pymongo threads into the child and can deadlock it.
+PROPHET_WORKERS = int(os.environ.get('PROPHET_WORKERS', os.cpu_count() or 1))
+PROPHET_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+def _create_prophet_executor():
+    return ProcessPoolExecutor(
+        max_workers=PROPHET_WORKERS,
+        mp_context=multiprocessing.get_context(PROPHET_START_METHOD)
+    )
+
+prophet_executor = _create_prophet_executor()
+
+def _prophet_params(train_df):
+    """Enable only the seasonalities the training span can actually estimate"""
+    span_days = (train_df['ds'].max() - train_df['ds'].min()).days
+    # Trading-day series have no weekend rows, so weekly terms for those days would be
+    # unconstrained and extrapolate wildly; only fit them when every weekday is observed
+    has_every_weekday = train_df['ds'].dt.dayofweek.nunique() == 7
+    return {
+        **PROPHET_PARAMS,
+        # Daily seasonality only applies to intraday data, never to daily OHLC rows
+        'daily_seasonality': False,
+        'weekly_seasonality': span_days >= 30 and has_every_weekday,
+        'yearly_seasonality': span_days >= 730
+    }
+
+def _model_cache_key(train_df, params):
+    """Key the cache on the training data itself, so a re-upload under the same id invalidates it"""
+    # Hash the ordered, vectorized per-row hashes; an XOR fold would let duplicated rows cancel out
+    row_hashes = pd.util.hash_pandas_object(train_df, index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(repr((sorted(params.items()), prophet.__version__)).encode())
+    return digest.hexdigest()
+
+def _load_cached_model(path):
+    """Load a fitted model from the disk cache, or None if it is missing or unreadable"""
+    try:
+        with open(path) as f:
+            model = model_from_json(f.read())
+        os.utime(path)
+        return model
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Drop corrupt or incompatible entries so the next fit replaces them
+        logger.warning(f"Discarding unreadable Prophet model cache {path.name}: {e}")
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+def _store_cached_model(path, model):
+    """Write a fitted model to the disk cache, evicting the least recently used entries"""
+    try:
+        MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_path, 'w') as f:
+            f.write(model_to_json(model))
+        os.replace(temp_path, path)
+        
+        cached = sorted(MODEL_CACHE_DIR.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for stale in cached[:max(len(cached) - MODEL_CACHE_DISK_ENTRIES, 0)]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not write Prophet model cache: {e}")
+
+def _fit_prophet(train_df):
+    """Return a fitted Prophet model, reusing a cached fit for identical training data"""
+    params = _prophet_params(train_df)
+    cache_key = _model_cache_key(train_df, params)
+    model = _model_cache.get(cache_key)
+    if model is not None:
+        _model_cache.move_to_end(cache_key)
+        return model
+    
+    cache_path = MODEL_CACHE_DIR / f"{cache_key}.json"
+    model = _load_cached_model(cache_path)
+    if model is None:
+        model = Prophet(**params)
+        model.fit(train_df)
+        _store_cached_model(cache_path, model)
+    
+    _model_cache[cache_key] = model
+    if len(_model_cache) > MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+    return model
+
+def _load_stock_frame(stock_record):
+    """Rebuild the uploaded DataFrame from a stock_data record"""
+    if 'data_parquet' in stock_record:
+        return pd.read_parquet(io.BytesIO(stock_record['data_parquet']))
+    
+    # Records uploaded before the Parquet format stored one document per row
+    df = pd.DataFrame(stock_record['data'])
+    df['Date'] = pd.to_datetime(df['Date'], format='ISO8601')
+    return df
+
+def _format_dates(dates):
+    """Format a datetime Series as YYYY-MM-DD strings without a per-element strftime"""
+    return dates.to_numpy().astype('datetime64[D]').astype(str)
+
+@njit
+def _write_iso_dates(days, out):
+    """Write days since epoch as comma-terminated YYYY-MM-DD ASCII (civil_from_days)"""
+    for i in range(days.shape[0]):
+        z = days[i] + 719468
+        era = z // 146097
+        doe = z - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (1 if month <= 2 else 0)
+        
+        o = i * 11
+        out[o] = 48 + year // 1000 % 10
+        out[o + 1] = 48 + year // 100 % 10
+        out[o + 2] = 48 + year // 10 % 10
+        out[o + 3] = 48 + year % 10
+        out[o + 4] = 45
+        out[o + 5] = 48 + month // 10
+        out[o + 6] = 48 + month % 10
+        out[o + 7] = 45
+        out[o + 8] = 48 + day // 10
+        out[o + 9] = 48 + day % 10
+        out[o + 10] = 44
+
+def _join_dates(dates):
+    """Format a datetime Series as one comma-joined YYYY-MM-DD string for the chart payload"""
+    if dates.empty:
+        return ''
+    
+    days = dates.to_numpy().astype('datetime64[D]').view(np.int64)
+    out = np.empty(len(days) * 11, dtype=np.uint8)
+    _write_iso_dates(days, out)
+    return out[:-1].tobytes().decode('ascii')
+
+def _encode_float32(values):
+    """Encode a numeric Series as a Plotly-style base64 little-endian float32 typed array"""
+    data = values.to_numpy(dtype='<f4').tobytes()
+    return {'dtype': 'f4', 'bdata': base64.b64encode(data).decode('ascii')}
+
+# Only these header fields hold datetimes; bulk fields (data_parquet, chart_data,
+# forecast_data) are formatted once with vectorized pandas calls and never walked
+DATETIME_FIELDS = ('upload_timestamp', 'created_timestamp')
+NESTED_FIELDS = ('date_range',)
+
 def prepare_for_mongo(data):
     """Convert datetime objects to ISO strings for MongoDB storage"""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-            elif isinstance(value, dict):
-                data[key] = prepare_for_mongo(value)
-            elif isinstance(value, list):
-                data[key] = [prepare_for_mongo(item) if isinstance(item, dict) else item for item in value]
+    for key in DATETIME_FIELDS:
+        value = data.get(key)
+        if isinstance(value, datetime):
+            data[key] = value.isoformat()
+    for key in NESTED_FIELDS:
+        value = data.get(key)
+        if isinstance(value, dict):
+            data[key] = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in value.items()}
     return data
 
 def parse_from_mongo(data):
     """Parse ISO string dates back to datetime objects"""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, str) and 'timestamp' in key:
-                try:
-                    data[key] = datetime.fromisoformat(value)
-                except:
-                    pass
-            elif isinstance(value, dict):
-                data[key] = parse_from_mongo(value)
+    for key in DATETIME_FIELDS:
+        value = data.get(key)
+        if isinstance(value, str):
+            try:
+                data[key] = datetime.fromisoformat(value)
+            except ValueError:
+                pass
     return data
 
+async def _parse_stock_upload(file, symbol):
+    """Validate an uploaded CSV and build its stock_data record"""
+    # Read the uploaded CSV file
+    contents = await file.read()
+    
+    # Read CSV with the multithreaded pyarrow parser, which infers ISO dates inline
+    df = pd.read_csv(io.BytesIO(contents), engine='pyarrow')
+    
+    # Validate required columns
+    required_columns = ['Date', 'Open', 'Higher', 'Lower', 'Last', 'Volume']
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    
+    if missing_columns:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Missing required columns: {', '.join(missing_columns)}"
+        )
+    
+    # Convert Date column to datetime unless pyarrow already inferred it
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
+    
+    # Validate data
+    if df.empty:
+        raise HTTPException(status_code=400, detail="CSV file is empty")
+    
+    if len(df) < 30:
+        raise HTTPException(status_code=400, detail="Need at least 30 data points for meaningful predictions")
+    
+    # Create stock data record
+    stock_data = StockData(
+        symbol=symbol,
+        filename=file.filename,
+        data_points=len(df),
+        date_range={
+            "start_date": df['Date'].min().isoformat(),
+            "end_date": df['Date'].max().isoformat()
+        }
+    )
+    
+    # Store the dataframe in MongoDB as a single zstd-compressed Parquet blob
+    parquet_buffer = io.BytesIO()
+    df.to_parquet(parquet_buffer, engine='pyarrow', compression='zstd', index=False)
+    
+    stock_dict = prepare_for_mongo(stock_data.dict())
+    stock_dict['data_parquet'] = Binary(parquet_buffer.getvalue())
+    
+    return df, stock_data, stock_dict
+
+def _run_prophet(train_df, validation_df, forecast_days):
+    """Fit (or reuse) a model and forecast; runs in a worker process, returns plain data only"""
+    model = _fit_prophet(train_df)
+    
+    # Predict only the validation dates and the forecast horizon in a single pass,
+    # instead of the full training history that make_future_dataframe would include
+    # Follow the observed calendar: trading-day series without weekend rows get business days
+    observed = pd.concat([train_df['ds'], validation_df['ds']])
+    freq = 'D' if (observed.dt.dayofweek >= 5).any() else 'B'
+    horizon = pd.date_range(
+        validation_df['ds'].max() + pd.Timedelta(days=1), periods=forecast_days, freq=freq
+    )
+    future = pd.concat([validation_df[['ds']], pd.DataFrame({'ds': horizon})], ignore_index=True)
+    forecast = model.predict(future)
+    
+    # Calculate metrics on validation data
+    validation_predictions = forecast.iloc[:len(validation_df)]
+    actual = validation_df['y'].to_numpy()
+    errors = actual - validation_predictions['yhat'].to_numpy()
+    rmse = float(np.sqrt(np.mean(errors * errors)))
+    # Same eps guard as sklearn's mean_absolute_percentage_error, so a zero price stays finite
+    mape = float(np.mean(np.abs(errors) / np.maximum(np.abs(actual), np.finfo(float).eps)) * 100)
+    
+    return forecast.tail(forecast_days), rmse, mape
+
+async def _build_prediction(data_id, df, symbol, forecast_days):
+    """Forecast a stock DataFrame and build the prediction result and its Mongo record"""
+    # Prepare data for Prophet (rename columns to 'ds' and 'y')
+    prophet_df = df[['Date', 'Last']].copy()
+    prophet_df.columns = ['ds', 'y']
+    prophet_df = prophet_df.sort_values('ds')
+    
+    # Split data for validation (use last 20% for testing)
+    split_idx = int(len(prophet_df) * 0.8)
+    train_df = prophet_df.iloc[:split_idx]
+    validation_df = prophet_df.iloc[split_idx:]
+    
+    # Fit and predict in a worker process so the event loop stays responsive
+    global prophet_executor
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = prophet_executor
+        try:
+            future_forecast, rmse, mape = await loop.run_in_executor(
+                executor, _run_prophet, train_df, validation_df, forecast_days
+            )
+            break
+        except BrokenProcessPool:
+            # A crashed worker (cmdstan segfault, OOM kill) breaks the pool for good; rebuild it once
+            if attempt:
+                raise
+            logger.warning("Prophet worker pool is broken, restarting it")
+            if prophet_executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                prophet_executor = _create_prophet_executor()
+    
+    # Prepare chart data
+    historical_data = {
+        'dates': _join_dates(prophet_df['ds']),
+        'actual': _encode_float32(prophet_df['y'])
+    }
+    
+    # Get forecast data (only future predictions)
+    forecast_data = {
+        'dates': _join_dates(future_forecast['ds']),
+        'forecast': _encode_float32(future_forecast['yhat']),
+        'lower_bound': _encode_float32(future_forecast['yhat_lower']),
+        'upper_bound': _encode_float32(future_forecast['yhat_upper'])
+    }
+    
+    # Create chart data for frontend
+    chart_data = {
+        'historical': historical_data,
+        'forecast': forecast_data,
+        'symbol': symbol
+    }
+    
+    # Create prediction result
+    result = PredictionResult(
+        data_id=data_id,
+        forecast_days=forecast_days,
+        rmse=round(rmse, 4),
+        mape=round(mape, 4),
+        chart_data=chart_data
+    )
+    
+    # Store forecast results for download
+    forecast_df = future_forecast.copy()
+    forecast_df['ds'] = _format_dates(forecast_df['ds'])
+    forecast_dict = forecast_df.to_dict('records')
+    
+    result_dict = prepare_for_mongo(result.dict())
+    result_dict['forecast_data'] = forecast_dict
+    
+    return result, result_dict
+
 @api_router.post("/upload-stock-data")
 async def upload_stock_data(file: UploadFile = File(...), symbol: str = "BNP"):
     try:
-        # Read the uploaded CSV file
-        contents = await file.read()
-        
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(mode='w+b', delete=False, suffix='.csv') as temp_file:
-            temp_file.write(contents)
-            temp_file_path = temp_file.name
-        
-        # Read CSV with pandas  
-        df = pd.read_csv(temp_file_path)
-        
-        # Clean up temp file
-        os.unlink(temp_file_path)
-        
-        # Validate required columns
-        required_columns = ['Date', 'Open', 'Higher', 'Lower', 'Last', 'Volume']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        
-        if missing_columns:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Missing required columns: {', '.join(missing_columns)}"
-            )
-        
-        # Convert Date column to datetime
-        df['Date'] = pd.to_datetime(df['Date'])
-        
-        # Validate data
-        if df.empty:
-            raise HTTPException(status_code=400, detail="CSV file is empty")
-        
-        if len(df) < 30:
-            raise HTTPException(status_code=400, detail="Need at least 30 data points for meaningful predictions")
-        
-        # Create stock data record
-        stock_data = StockData(
-            symbol=symbol,
-            filename=file.filename,
-            data_points=len(df),
-            date_range={
-                "start_date": df['Date'].min().isoformat(),
-                "end_date": df['Date'].max().isoformat()
-            }
-        )
-        
-        # Store the dataframe data in MongoDB
-        df_dict = df.to_dict('records')
-        # Convert datetime objects to strings for MongoDB
-        for record in df_dict:
-            record['Date'] = record['Date'].isoformat()
-        
-        stock_dict = prepare_for_mongo(stock_data.dict())
-        stock_dict['data'] = df_dict
+        df, stock_data, stock_dict = await _parse_stock_upload(file, symbol)
         
         await db.stock_data.insert_one(stock_dict)
         
@@ -160,88 +436,56 @@ async def predict_stock_prices(request: PredictionRequest):
             raise HTTPException(status_code=404, detail="Stock data not found")
         
         # Convert back to DataFrame
-        df_data = stock_record['data']
-        df = pd.DataFrame(df_data)
-        df['Date'] = pd.to_datetime(df['Date'])
-        
-        # Prepare data for Prophet (rename columns to 'ds' and 'y')
-        prophet_df = df[['Date', 'Last']].copy()
-        prophet_df.columns = ['ds', 'y']
-        prophet_df = prophet_df.sort_values('ds')
+        df = _load_stock_frame(stock_record)
         
-        # Split data for validation (use last 20% for testing)
-        split_idx = int(len(prophet_df) * 0.8)
-        train_df = prophet_df.iloc[:split_idx]
-        validation_df = prophet_df.iloc[split_idx:]
-        
-        # Initialize and fit Prophet model
-        model = Prophet(
-            daily_seasonality=True,
-            weekly_seasonality=True,
-            yearly_seasonality=True,
-            changepoint_prior_scale=0.05
+        result, result_dict = await _build_prediction(
+            request.data_id, df, stock_record['symbol'], request.forecast_days
         )
         
-        model.fit(train_df)
-        
-        # Create future dataframe for validation period
-        validation_future = model.make_future_dataframe(periods=len(validation_df))
-        validation_forecast = model.predict(validation_future)
-        
-        # Calculate metrics on validation data
-        validation_predictions = validation_forecast.tail(len(validation_df))
-        rmse = np.sqrt(mean_squared_error(validation_df['y'], validation_predictions['yhat']))
-        mape = mean_absolute_percentage_error(validation_df['y'], validation_predictions['yhat']) * 100
-        
-        # Now make future predictions
-        future = model.make_future_dataframe(periods=request.forecast_days)
-        forecast = model.predict(future)
-        
-        # Prepare chart data
-        historical_data = {
-            'dates': prophet_df['ds'].dt.strftime('%Y-%m-%d').tolist(),
-            'actual': prophet_df['y'].tolist()
-        }
-        
-        # Get forecast data (only future predictions)
-        future_forecast = forecast.tail(request.forecast_days)
-        forecast_data = {
-            'dates': future_forecast['ds'].dt.strftime('%Y-%m-%d').tolist(),
-            'forecast': future_forecast['yhat'].tolist(),
-            'lower_bound': future_forecast['yhat_lower'].tolist(),
-            'upper_bound': future_forecast['yhat_upper'].tolist()
-        }
+        await db.predictions.insert_one(result_dict)
         
-        # Create chart data for frontend
-        chart_data = {
-            'historical': historical_data,
-            'forecast': forecast_data,
-            'symbol': stock_record['symbol']
-        }
+        return result
         
-        # Create prediction result
-        result = PredictionResult(
-            data_id=request.data_id,
-            forecast_days=request.forecast_days,
-            rmse=round(rmse, 4),
-            mape=round(mape, 4),
-            chart_data=chart_data
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error making predictions: {str(e)}")
+
+@api_router.post("/upload-and-predict")
+async def upload_and_predict(
+    file: UploadFile = File(...),
+    symbol: str = "BNP",
+    forecast_days: int = Query(..., ge=7, le=30)
+):
+    """Upload a CSV and forecast it in one request, writing both records concurrently"""
+    try:
+        df, stock_data, stock_dict = await _parse_stock_upload(file, symbol)
+        result, result_dict = await _build_prediction(stock_data.id, df, symbol, forecast_days)
+        
+        # The records live in different collections, so a single bulk_write cannot
+        # cover both; the two inserts run in parallel on separate pooled connections
+        stock_write, prediction_write = await asyncio.gather(
+            db.stock_data.insert_one(stock_dict),
+            db.predictions.insert_one(result_dict),
+            return_exceptions=True
         )
         
-        # Store forecast results for download
-        forecast_df = future_forecast.copy()
-        forecast_df['ds'] = forecast_df['ds'].dt.strftime('%Y-%m-%d')
-        forecast_dict = forecast_df.to_dict('records')
-        
-        result_dict = prepare_for_mongo(result.dict())
-        result_dict['forecast_data'] = forecast_dict
-        
-        await db.predictions.insert_one(result_dict)
+        # Never leave one record without the other: roll back whichever insert succeeded
+        if isinstance(stock_write, Exception) or isinstance(prediction_write, Exception):
+            if not isinstance(stock_write, Exception):
+                await db.stock_data.delete_one({"id": stock_data.id})
+            if not isinstance(prediction_write, Exception):
+                await db.predictions.delete_one({"id": result.id})
+            raise stock_write if isinstance(stock_write, Exception) else prediction_write
         
-        return result
+        return {
+            "data_id": stock_data.id,
+            "symbol": symbol,
+            "data_points": len(df),
+            "date_range": stock_data.date_range,
+            "prediction": result
+        }
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error making predictions: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing upload and prediction: {str(e)}")
 
 @api_router.get("/download-forecast/{prediction_id}")
 async def download_forecast(prediction_id: str):
@@ -251,17 +495,29 @@ async def download_forecast(prediction_id: str):
         if not prediction:
             raise HTTPException(status_code=404, detail="Prediction not found")
         
-        # Convert forecast data to CSV
-        forecast_df = pd.DataFrame(prediction['forecast_data'])
-        
-        # Create CSV string
-        csv_buffer = io.StringIO()
-        forecast_df.to_csv(csv_buffer, index=False)
-        csv_content = csv_buffer.getvalue()
+        # Stream the forecast rows as CSV without buffering the whole file
+        forecast_rows = prediction['forecast_data']
+        columns = list(forecast_rows[0].keys()) if forecast_rows else []
+        
+        def generate_csv():
+            # Reuse one small buffer per row so quoting and NaN/None handling match DataFrame.to_csv
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            
+            def write_row(values):
+                writer.writerow(['' if isinstance(v, float) and math.isnan(v) else v for v in values])
+                line = buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+                return line
+            
+            yield write_row(columns)
+            for row in forecast_rows:
+                yield write_row(row.get(col) for col in columns)
         
         # Return as downloadable file
         return StreamingResponse(
-            io.BytesIO(csv_content.encode()),
+            generate_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename=forecast_{prediction_id}.csv"}
         )
@@ -269,11 +525,23 @@ async def download_forecast(prediction_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading forecast: {str(e)}")
 
+# Listing only needs metadata, not the embedded chart and forecast arrays
+PREDICTION_LIST_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "data_id": 1,
+    "forecast_days": 1,
+    "created_timestamp": 1,
+    "rmse": 1,
+    "mape": 1,
+    "chart_data.symbol": 1
+}
+
 @api_router.get("/predictions")
 async def get_predictions():
     """Get all predictions for listing"""
     try:
-        predictions = await db.predictions.find().to_list(100)
+        predictions = await db.predictions.find({}, PREDICTION_LIST_PROJECTION).to_list(100)
         return [parse_from_mongo(pred) for pred in predictions]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving predictions: {str(e)}")
@@ -296,6 +564,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_db_indexes():
+    await db.stock_data.create_index("id", unique=True)
+    await db.predictions.create_index("id", unique=True)
+
+@app.on_event("startup")
+async def warm_up_date_kernel():
+    # Compile the Numba kernel before the first request instead of inside it
+    _join_dates(pd.Series(pd.to_datetime(['1970-01-01'])))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+    prophet_executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -176,6 +176,46 @@ class BNPStockPredictorTester:
         )
         return True  # We expect this to fail, so success means test passed
 
+    def test_upload_and_predict(self):
+        """Test uploading a CSV and generating predictions in one request"""
+        csv_path = "/app/sample_bnp_data.csv"
+        
+        if not os.path.exists(csv_path):
+            print(f"❌ Sample CSV file not found at {csv_path}")
+            return False
+            
+        with open(csv_path, 'rb') as f:
+            files = {'file': ('sample_bnp_data.csv', f, 'text/csv')}
+            data = {'symbol': 'BNP'}
+            
+            success, response = self.run_test(
+                "Upload and Predict",
+                "POST",
+                "upload-and-predict?forecast_days=14",
+                200,
+                data=data,
+                files=files
+            )
+            
+        if success:
+            if 'data_id' not in response:
+                print("❌ Missing required field: data_id")
+                return False
+            
+            prediction = response.get('prediction', {})
+            for field in ['rmse', 'chart_data']:
+                if field not in prediction:
+                    print(f"❌ Missing required prediction field: {field}")
+                    return False
+            
+            chart_data = prediction['chart_data']
+            if 'historical' not in chart_data or 'forecast' not in chart_data:
+                print("❌ Invalid chart_data structure")
+                return False
+                
+            return True
+        return False
+
     def test_download_forecast(self):
         """Test downloading forecast CSV"""
         if not self.prediction_id:
@@ -227,6 +267,7 @@ def main():
         ("Generate Predictions", tester.test_predict_stock_prices),
         ("Predict Invalid Data ID", tester.test_predict_invalid_data_id),
         ("Predict Invalid Forecast Days", tester.test_predict_invalid_forecast_days),
+        ("Upload and Predict", tester.test_upload_and_predict),
         ("Download Forecast", tester.test_download_forecast),
         ("Download Invalid Prediction", tester.test_download_invalid_prediction),
         ("Get All Predictions", tester.test_get_predictions),
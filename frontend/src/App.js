@@ -121,6 +121,12 @@ function App() {
     }
   };
 
+  // Decode a base64 little-endian float32 typed array sent by the API
+  const decodeFloat32 = ({ bdata }) => {
+    const bytes = Uint8Array.from(atob(bdata), (c) => c.charCodeAt(0));
+    return new Float32Array(bytes.buffer);
+  };
+
   const createChart = () => {
     if (!predictionResult) return null;
 
@@ -130,21 +136,25 @@ function App() {
     const chartData = [];
     
     // Add historical data
-    historical.dates.forEach((date, index) => {
+    const historicalActual = decodeFloat32(historical.actual);
+    historical.dates.split(',').forEach((date, index) => {
       chartData.push({
         date: date,
-        actual: historical.actual[index],
+        actual: historicalActual[index],
         type: 'historical'
       });
     });
     
     // Add forecast data
-    forecast.dates.forEach((date, index) => {
+    const forecastValues = decodeFloat32(forecast.forecast);
+    const upperBound = decodeFloat32(forecast.upper_bound);
+    const lowerBound = decodeFloat32(forecast.lower_bound);
+    forecast.dates.split(',').forEach((date, index) => {
       chartData.push({
         date: date,
-        forecast: forecast.forecast[index],
-        upper: forecast.upper_bound[index],
-        lower: forecast.lower_bound[index],
+        forecast: forecastValues[index],
+        upper: upperBound[index],
+        lower: lowerBound[index],
         type: 'forecast'
       });
     });
@@ -0,0 +1,137 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+for module in ('pandas', 'numpy', 'prophet', 'fastapi', 'motor', 'pyarrow', 'dotenv', 'orjson', 'numba'):
+    pytest.importorskip(module)
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+import server
+
+
+def _train_df(days=60, offset=0.0):
+    dates = pd.date_range('2024-01-01', periods=days, freq='D')
+    return pd.DataFrame({'ds': dates, 'y': [100.0 + offset + i * 0.5 for i in range(days)]})
+
+
+def _fit(train_df):
+    model = server.Prophet(**server._prophet_params(train_df))
+    model.fit(train_df)
+    return model
+
+
+def _sample_prophet_df():
+    df = pd.read_csv(Path(__file__).resolve().parent.parent / 'sample_bnp_data.csv', parse_dates=['Date'])
+    prophet_df = df[['Date', 'Last']].rename(columns={'Date': 'ds', 'Last': 'y'}).sort_values('ds')
+    split_idx = int(len(prophet_df) * 0.8)
+    return prophet_df.iloc[:split_idx], prophet_df.iloc[split_idx:]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, 'MODEL_CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+def test_model_cache_round_trip(cache_dir):
+    train_df = _train_df()
+    model = _fit(train_df)
+    path = cache_dir / f"{server._model_cache_key(train_df, server._prophet_params(train_df))}.json"
+
+    server._store_cached_model(path, model)
+    loaded = server._load_cached_model(path)
+
+    assert loaded is not None
+    future = pd.DataFrame({'ds': pd.date_range('2024-03-01', periods=5, freq='D')})
+    pd.testing.assert_series_equal(model.predict(future)['yhat'], loaded.predict(future)['yhat'])
+
+
+def test_model_cache_evicts_least_recently_used(cache_dir, monkeypatch):
+    monkeypatch.setattr(server, 'MODEL_CACHE_DISK_ENTRIES', 1)
+    model = _fit(_train_df())
+    old_path, new_path = cache_dir / 'old.json', cache_dir / 'new.json'
+
+    server._store_cached_model(old_path, model)
+    os.utime(old_path, (0, 0))
+    server._store_cached_model(new_path, model)
+
+    assert not old_path.exists()
+    assert new_path.exists()
+
+
+def test_model_cache_discards_unreadable_entry(cache_dir):
+    path = cache_dir / 'broken.json'
+    path.write_text('{}')
+
+    assert server._load_cached_model(path) is None
+    assert not path.exists()
+
+
+def test_model_cache_key_tracks_training_data():
+    train_df = _train_df()
+    params = server._prophet_params(train_df)
+
+    assert server._model_cache_key(train_df, params) == server._model_cache_key(train_df.copy(), params)
+    assert server._model_cache_key(train_df, params) != server._model_cache_key(_train_df(offset=1.0), params)
+
+
+def test_model_cache_key_does_not_cancel_duplicate_rows():
+    dates = pd.to_datetime(['2024-01-01', '2024-01-01', '2024-01-02'])
+    first = pd.DataFrame({'ds': dates, 'y': [1.0, 1.0, 3.0]})
+    second = pd.DataFrame({'ds': dates, 'y': [2.0, 2.0, 3.0]})
+    params = server._prophet_params(first)
+
+    assert server._model_cache_key(first, params) != server._model_cache_key(second, params)
+
+
+@pytest.mark.parametrize('dates', [
+    ['1700-02-28', '1700-03-01', '1800-12-31', '1900-02-28', '1900-03-01', '1904-02-29'],
+    ['1969-12-31', '1970-01-01', '1999-12-31', '2000-02-29', '2000-03-01', '2024-02-29'],
+    ['2100-02-28', '2100-03-01', '2200-01-01'],
+])
+def test_join_dates_matches_numpy_formatting(dates):
+    series = pd.Series(pd.to_datetime(dates))
+
+    assert server._join_dates(series) == ','.join(server._format_dates(series))
+
+
+def test_join_dates_over_a_long_range():
+    series = pd.Series(pd.date_range('1690-01-01', '2250-12-31', freq='37D'))
+
+    assert server._join_dates(series) == ','.join(server._format_dates(series))
+
+
+def test_join_dates_empty():
+    assert server._join_dates(pd.Series(pd.to_datetime([]))) == ''
+
+
+def test_weekly_seasonality_requires_every_weekday():
+    train_df, _ = _sample_prophet_df()
+    assert not server._prophet_params(train_df)['weekly_seasonality']
+
+    calendar_df = _train_df(days=60)
+    assert server._prophet_params(calendar_df)['weekly_seasonality']
+
+
+def test_sample_forecast_stays_in_a_sane_band(cache_dir):
+    train_df, validation_df = _sample_prophet_df()
+
+    forecast, rmse, mape = server._run_prophet(train_df, validation_df, 14)
+
+    low, high = train_df['y'].min(), train_df['y'].max()
+    assert forecast['yhat'].between(low * 0.8, high * 1.2).all()
+    assert rmse >= 0 and 0 <= mape < 100
+
+
+def test_trading_day_horizon_skips_weekends(cache_dir):
+    train_df, validation_df = _sample_prophet_df()
+
+    forecast, _, _ = server._run_prophet(train_df, validation_df, 14)
+
+    assert len(forecast) == 14
+    assert (forecast['ds'].dt.dayofweek < 5).all()
+    assert forecast['ds'].min() > validation_df['ds'].max()